@@ -73,11 +73,9 @@ def apply_mask(image, mask, color, alpha=0.5):
     """Apply the given mask to the image.
     """
 
-    for c in range(3):
-        image[:, :, c] = np.where(mask == 1,
-                                  image[:, :, c] *
-                                  (1 - alpha) + alpha * color[c] * 255,
-                                  image[:, :, c])
+    m = mask == 1
+    image[m, :3] = (image[m, :3] * (1 - alpha) +
+                    alpha * np.asarray(color[:3]) * 255)
     return image
 
 
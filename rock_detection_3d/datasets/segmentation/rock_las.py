@@ -184,12 +184,20 @@ class RockLAS(InMemoryDataset):
             # print(name)
             las_file = os.path.join(self.raw_dir, name)
             las = laspy.read(las_file)
-            pos = np.array((las.x.scaled_array(), las.y.scaled_array(), las.z.scaled_array())).transpose().astype(np.float64)
-            x = np.array((las.red, las.green, las.blue)).transpose().astype(np.float64) / (2**16)
+            n_points = len(las.x)
+            pos = np.empty((n_points, 3), dtype=np.float64)
+            pos[:, 0] = las.x.scaled_array()
+            pos[:, 1] = las.y.scaled_array()
+            pos[:, 2] = las.z.scaled_array()
+            x = np.empty((n_points, 3), dtype=np.float64)
+            x[:, 0] = las.red
+            x[:, 1] = las.green
+            x[:, 2] = las.blue
+            x *= 1.0 / 2**16
             try:
                 y = (las.isPBR==0)*1
             except AttributeError:
-                y = np.logical_not((las.notPBR==1))*1
+                y = (las.notPBR!=1)*1
             pos = torch.from_numpy(pos) 
             y = torch.from_numpy(y)
             x = torch.from_numpy(x) 
@@ -199,10 +207,9 @@ class RockLAS(InMemoryDataset):
             
             # normalize scale
             center = pos.mean(axis=0)
-            pos = pos - center
+            pos -= center
             scale = ((1 / pos.abs().max()) * 0.999999).reshape((1))
-            pos = pos * scale
-            normalize_attr = {'center': center, 'scale': scale}
+            pos *= scale
             
             data = Data(pos=pos, x=x, y=y, category=category, id_scan=id_scan_tensor, scale=scale, center=center, file_name=name)
             data = SaveOriginalPosId()(data)
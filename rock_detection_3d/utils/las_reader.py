@@ -16,15 +16,35 @@ class Las_Reader(object):
     def __len__(self):
         return len(self.las)
     
-    def get_raw(self, i):
-        assert i < self.__len__()
+    def _get_pos(self, i):
+        las = self.las[i]
+        pos = np.empty((len(las.x), 3), dtype=np.float64)
+        pos[:, 0] = las.x.scaled_array()
+        pos[:, 1] = las.y.scaled_array()
+        pos[:, 2] = las.z.scaled_array()
+        return pos
+    
+    def _get_color(self, i):
+        las = self.las[i]
+        color = np.empty((len(las.red), 3), dtype=np.uint16)
+        color[:, 0] = las.red
+        color[:, 1] = las.green
+        color[:, 2] = las.blue
+        return color
+    
+    def _get_label(self, i):
         las = self.las[i]
-        pos = np.array((las.x.scaled_array(), las.y.scaled_array(), las.z.scaled_array())).transpose().astype(np.float64)
-        color = np.array((las.red, las.green, las.blue)).transpose().astype(np.float64) / (2**16)
         try:
             label = (las.isPBR==0)*1
         except AttributeError:
-            label = np.logical_not((las.notPBR==1))*1
+            label = (las.notPBR!=1)*1
+        return label
+    
+    def get_raw(self, i):
+        assert i < self.__len__()
+        pos = self._get_pos(i)
+        color = self._get_color(i) * (1.0 / 2**16)
+        label = self._get_label(i)
         
         return pos, color, label
     
@@ -33,26 +53,25 @@ class Las_Reader(object):
         center = pos.mean(axis=0)
         pos = pos - center
         scale = ((1 / np.abs(pos).max()) * 0.999999).reshape((1))
-        pos = pos * scale
+        pos *= scale
         
         return pos, color, label
     
     def compose(self):
         
-        pos = []
-        color = []
-        label = []
-        
-        for i in range(self.__len__()):
-            p, c, l = self.get_raw(i)
-            pos.append(p)
-            color.append(c* (2**16))
-            label.append((l>0)*(i+1))
-        
-        if len(pos) > 0:
-            pos = np.vstack(pos)
-            color = np.vstack(color)
-            label = np.hstack(label)
+        if self.__len__() > 0:
+            n_points = sum(len(las.x) for las in self.las)
+            pos = np.empty((n_points, 3), dtype=np.float64)
+            color = np.empty((n_points, 3), dtype=np.uint16)
+            label = np.empty(n_points, dtype=np.int64)
+            
+            start = 0
+            for i in range(self.__len__()):
+                end = start + len(self.las[i].x)
+                pos[start:end] = self._get_pos(i)
+                color[start:end] = self._get_color(i)
+                np.multiply(self._get_label(i)>0, i+1, out=label[start:end])
+                start = end
             
             header = laspy.LasHeader(point_format=2, version="1.2")
             header.scales = np.array([0.01, 0.01, 0.01])
@@ -98,11 +117,3 @@ class Read_Las_from_Json(Las_Reader):
         las_files.sort()
         for las_file in las_files:
             self.las.append(laspy.read(las_file))
-            
-    
-
-
-    
-las_path = '../../notebooks/data/rocklas/prediction'
-train_path = '../../notebooks/data/rocklas/raw'
-json_path = '../../notebooks/data/rocklas/raw/train_split.json'
\ No newline at end of file